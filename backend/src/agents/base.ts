@@ -290,6 +290,28 @@ export class TokenCounter {
     return Math.ceil(text.length / 4);
   }
 
+  /**
+   * Count whitespace-separated words without materializing a split() array
+   */
+  static countWords(text: string): number {
+    let count = 0;
+    let inWord = false;
+
+    for (let i = 0; i < text.length; i++) {
+      const code = text.charCodeAt(i);
+      // space, \t, \n, \v, \f, \r, NBSP
+      const isSpace = code === 32 || (code >= 9 && code <= 13) || code === 160;
+      if (isSpace) {
+        inWord = false;
+      } else if (!inWord) {
+        inWord = true;
+        count++;
+      }
+    }
+
+    return count;
+  }
+
   /**
    * Count tokens in structured data
    */
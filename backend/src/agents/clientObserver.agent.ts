@@ -32,6 +32,9 @@ export const NEGATIVE_EMOTIONS = [
   'overwhelmed'
 ] as const;
 
+// O(1) membership check used when normalizing model output
+const VALID_EMOTIONS: ReadonlySet<string> = new Set<string>([...POSITIVE_EMOTIONS, ...NEGATIVE_EMOTIONS]);
+
 export type PositiveEmotion = typeof POSITIVE_EMOTIONS[number];
 export type NegativeEmotion = typeof NEGATIVE_EMOTIONS[number];
 export type Emotion = PositiveEmotion | NegativeEmotion;
@@ -229,10 +232,7 @@ CRITICAL: Be a REAL person, not a critic. Score based on whether this would make
       const parsed = JSON.parse(jsonStr);
 
       // Validate and normalize emotions
-      const validEmotions = [...POSITIVE_EMOTIONS, ...NEGATIVE_EMOTIONS] as string[];
-      const emotions = (parsed.emotions || [])
-        .map((e: string) => e.toLowerCase())
-        .filter((e: string) => validEmotions.includes(e)) as Emotion[];
+      const emotions = this.normalizeEmotions(parsed.emotions);
 
       // Ensure score is in valid range
       const score = Math.min(10, Math.max(1, Number(parsed.score) || 5));
@@ -533,6 +533,23 @@ Return JSON with:
 }`;
   }
 
+  /**
+   * Lowercase and validate emotions in a single pass over the raw list
+   */
+  private normalizeEmotions(raw: unknown): Emotion[] {
+    const emotions: Emotion[] = [];
+    if (!Array.isArray(raw)) return emotions;
+
+    for (const value of raw) {
+      if (typeof value !== 'string') continue;
+      const emotion = value.toLowerCase();
+      if (VALID_EMOTIONS.has(emotion)) {
+        emotions.push(emotion as Emotion);
+      }
+    }
+    return emotions;
+  }
+
   private getEmotionVocabulary(): string {
     return `Positive: awe, inspired, touched, laughter, provoked, excited, confident, reassured
 Negative: confused, disconnected, bored, agitated, skeptical, indifferent, overwhelmed`;
@@ -553,10 +570,7 @@ Negative: confused, disconnected, bored, agitated, skeptical, indifferent, overw
       }
 
       const parsed = JSON.parse(jsonStr);
-      const validEmotions = [...POSITIVE_EMOTIONS, ...NEGATIVE_EMOTIONS] as string[];
-      const emotions = (parsed.emotions || [])
-        .map((e: string) => e.toLowerCase())
-        .filter((e: string) => validEmotions.includes(e)) as Emotion[];
+      const emotions = this.normalizeEmotions(parsed.emotions);
 
       const score = Math.min(10, Math.max(1, Number(parsed.score) || 5));
 
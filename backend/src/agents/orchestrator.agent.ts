@@ -15,6 +15,9 @@ import { WeeklyTaskPlanAgent } from './weeklyTaskPlan.agent';
 import { ProjectScheduleGeneratorAgent } from './projectScheduleGenerator.agent';
 import { WeeklyDistributionAgent } from './weeklyDistribution.agent';
 import { ExpandBriefAgent } from './expandBrief.agent';
+import { ClientObserverAgent } from './clientObserver.agent';
+import { aiService } from '../services/aiService';
+import { promptEngine } from '../services/promptEngine';
 import { tokenUsageService } from '../services/tokenUsage';
 import pool from '../database/db';
 
@@ -573,9 +576,6 @@ export class OrchestratorAgent extends BaseAgent {
     });
 
     // STEP 2: Build the prompts using promptEngine
-    const { PromptEngine } = await import('../services/promptEngine');
-    const promptEngine = new PromptEngine();
-
     const prompts = promptEngine.generateCompanyStrategyPrompt({
       brandName,
       tagline,
@@ -588,7 +588,6 @@ export class OrchestratorAgent extends BaseAgent {
     });
 
     // STEP 3: Call AI with selected model
-    const { aiService } = await import('../services/aiService');
     const aiResult = await aiService.generate({
       model: recommendation.model,
       systemPrompt: prompts.system,
@@ -1106,7 +1105,6 @@ export class OrchestratorAgent extends BaseAgent {
 
     // Client Observer Feedback Loop (only for non-streaming)
     if (!payload.stream && expandedBrief && payload.brandContext?.buyerProfile) {
-      const { ClientObserverAgent } = await import('./clientObserver.agent');
       const observer = new ClientObserverAgent('gpt-4o-mini', OBSERVER_THRESHOLD);
 
       this.log('Starting Client Observer evaluation loop');
@@ -10,7 +10,7 @@
  * - RICH, DETAILED narrative descriptions (400-600 words)
  */
 
-import { BaseAgent, AgentInput, AgentOutput, AIModel } from './base';
+import { BaseAgent, AgentInput, AgentOutput, AIModel, TokenCounter } from './base';
 import { PromptEngine } from '../services/promptEngine';
 import { aiService } from '../services/aiService';
 
@@ -241,7 +241,7 @@ export class SeasonPlotAgent extends BaseAgent {
     }
 
     // Validate that explanation is present
-    const wordCount = monthlyPlot.explanation.split(/\s+/).length;
+    const wordCount = TokenCounter.countWords(monthlyPlot.explanation);
 
     this.log('Monthly plot generated successfully', {
       themeLength: monthlyPlot.theme.length,
@@ -12,7 +12,7 @@
  * - Posting rhythm and hooks
  */
 
-import { BaseAgent, AgentInput, AgentOutput, AIModel } from './base';
+import { BaseAgent, AgentInput, AgentOutput, AIModel, TokenCounter } from './base';
 import { PromptEngine } from '../services/promptEngine';
 import { aiService } from '../services/aiService';
 import { NextSceneHook } from '../services/brandContext';
@@ -189,7 +189,7 @@ export class SubplotWriterAgent extends BaseAgent {
     }
 
     // Validate richness (should be 400-600 words)
-    const wordCount = subplot.subplot_description.split(/\s+/).length;
+    const wordCount = TokenCounter.countWords(subplot.subplot_description);
     if (wordCount < 300) {
       this.log('Warning: Subplot description may be too brief', { wordCount });
     }
@@ -1,12 +1,29 @@
 import { FastifyRequest, FastifyReply } from 'fastify';
-import bcrypt from 'bcryptjs';
-import jwt from 'jsonwebtoken';
 import crypto from 'crypto';
-import { UserModel } from '../models/User';
+import { UserModel, User } from '../models/User';
 import { body, validationResult } from 'express-validator';
 import { emailService } from '../services/emailService';
 import pool from '../database/db';
 import { AuthRequest } from '../middleware/auth';
+import { hashPassword, verifyPassword, needsRehash } from '../utils/password';
+
+// Token + user payload returned by register and login: one sign through the
+// plugin's pre-built signer (secret and expiry configured at registration)
+const createSession = (request: FastifyRequest, user: User) => ({
+  token: request.server.jwt.sign({ id: user.id, email: user.email }),
+  user: {
+    user_id: user.id,
+    email: user.email,
+    full_name: user.full_name,
+    plan: user.plan || 'free',
+    tokens: user.tokens || 10000,
+    plan_expiry: user.plan_expiry,
+    preferred_ai_provider: user.preferred_ai_provider || 'openai',
+    preferred_ai_model: user.preferred_ai_model || 'gpt-4',
+    timezone: user.timezone || 'Africa/Lagos',
+    is_admin: user.is_admin || false,
+  },
+});
 
 export const authController = {
   // Register new user
@@ -33,7 +50,7 @@ export const authController = {
       }
 
       // Hash password
-      const password_hash = await bcrypt.hash(password, 12);
+      const password_hash = await hashPassword(password);
 
       // Create user
       const user = await UserModel.create({
@@ -42,28 +59,9 @@ export const authController = {
         full_name,
       });
 
-      // Generate JWT
-      const token = jwt.sign(
-        { id: user.id, email: user.email },
-        process.env.JWT_SECRET || 'default-secret-key',
-        { expiresIn: '7d' }
-      );
-
       reply.status(201).send({
         message: 'User created successfully',
-        token,
-        user: {
-          user_id: user.id,
-          email: user.email,
-          full_name: user.full_name,
-          plan: user.plan || 'free',
-          tokens: user.tokens || 10000,
-          plan_expiry: user.plan_expiry,
-          preferred_ai_provider: user.preferred_ai_provider || 'openai',
-          preferred_ai_model: user.preferred_ai_model || 'gpt-4',
-          timezone: user.timezone || 'Africa/Lagos',
-          is_admin: user.is_admin || false,
-        },
+        ...createSession(request, user),
       });
     } catch (error) {
       console.error('Registration error:', error);
@@ -90,37 +88,26 @@ export const authController = {
       }
 
       // Check password
-      const isValidPassword = await bcrypt.compare(password, user.password_hash);
+      const isValidPassword = await verifyPassword(password, user.password_hash);
       if (!isValidPassword) {
         reply.status(401).send({ error: 'Invalid credentials' });
         return;
       }
 
+      // Upgrade bcrypt / outdated-cost hashes while we hold the plaintext;
+      // off the response path, a failure just retries on the next login
+      if (needsRehash(user.password_hash)) {
+        hashPassword(password)
+          .then((password_hash) => UserModel.updatePasswordHash(user.id, password_hash, user.password_hash))
+          .catch((error) => console.error('Password rehash error:', error));
+      }
+
       // Update last login
       await UserModel.updateLastLogin(user.id);
 
-      // Generate JWT
-      const token = jwt.sign(
-        { id: user.id, email: user.email },
-        process.env.JWT_SECRET || 'default-secret-key',
-        { expiresIn: '7d' }
-      );
-
       reply.send({
         message: 'Login successful',
-        token,
-        user: {
-          user_id: user.id,
-          email: user.email,
-          full_name: user.full_name,
-          plan: user.plan || 'free',
-          tokens: user.tokens || 10000,
-          plan_expiry: user.plan_expiry,
-          preferred_ai_provider: user.preferred_ai_provider || 'openai',
-          preferred_ai_model: user.preferred_ai_model || 'gpt-4',
-          timezone: user.timezone || 'Africa/Lagos',
-          is_admin: user.is_admin || false,
-        },
+        ...createSession(request, user),
       });
     } catch (error) {
       console.error('Login error:', error);
@@ -247,7 +234,7 @@ export const authController = {
       const userId = tokenResult.rows[0].user_id;
 
       // Hash new password
-      const password_hash = await bcrypt.hash(password, 12);
+      const password_hash = await hashPassword(password);
 
       // Update user password
       await pool.query(
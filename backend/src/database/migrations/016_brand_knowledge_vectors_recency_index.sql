@@ -0,0 +1,7 @@
+-- Migration: Recency index for brand knowledge vectors
+-- Description: Vector queries pick each brand's 200 most recently updated
+-- documents; this index serves that as an ordered index scan instead of
+-- sorting every brand row per query
+
+CREATE INDEX IF NOT EXISTS idx_brand_knowledge_vectors_recent
+  ON brand_knowledge_vectors(brand_id, updated_at DESC);
@@ -1,5 +1,7 @@
+import crypto from 'crypto';
 import { FastifyRequest, FastifyReply } from 'fastify';
 import pool from '../database/db';
+import { JWT_REJECTED_CACHE_SIZE, JWT_REJECTED_CACHE_TTL_MS } from '../utils/jwtConfig';
 
 // Using type alias instead of interface to avoid conflicts with Fastify's JWT types
 export type AuthRequest = FastifyRequest & {
@@ -10,29 +12,99 @@ export type AuthRequest = FastifyRequest & {
   };
 };
 
+// Error bodies for the auth hot path, built once instead of per rejected request
+const AUTH_ERROR_BODIES = Object.freeze({
+  invalidToken: Object.freeze({ error: 'Invalid or expired token' }),
+  notAuthenticated: Object.freeze({ error: 'Not authenticated' }),
+  adminRequired: Object.freeze({ error: 'Admin access required' }),
+  adminCheckFailed: Object.freeze({ error: 'Failed to verify admin access' }),
+});
+
+// Thrown after the error reply is sent, only to stop the route handler; they
+// carry no per-request data, so one instance each is reused
+const MISSING_TOKEN_ERROR = new Error('Missing bearer token');
+const INVALID_TOKEN_ERROR = new Error('Invalid or expired token');
+const NOT_AUTHENTICATED_ERROR = new Error('Not authenticated');
+const ADMIN_REQUIRED_ERROR = new Error('Admin access required');
+
+// Recently rejected tokens -> expiry time (Map keeps insertion order, so the
+// first key is the oldest). Kept apart from the verifier's success cache.
+// Keyed by a SHA-256 of the token, so entries are a fixed size whatever the
+// client sends and raw tokens are never held in memory.
+const rejectedTokens = new Map<string, number>();
+
+const rejectedTokenKey = (token: string): string =>
+  crypto.createHash('sha256').update(token).digest('base64');
+
+const isRecentlyRejected = (key: string): boolean => {
+  const expiresAt = rejectedTokens.get(key);
+  if (expiresAt === undefined) return false;
+  if (expiresAt > Date.now()) return true;
+  rejectedTokens.delete(key);
+  return false;
+};
+
+const rememberRejected = (key: string): void => {
+  if (JWT_REJECTED_CACHE_SIZE === 0 || JWT_REJECTED_CACHE_TTL_MS === 0) return;
+  rejectedTokens.delete(key);
+  rejectedTokens.set(key, Date.now() + JWT_REJECTED_CACHE_TTL_MS);
+  if (rejectedTokens.size > JWT_REJECTED_CACHE_SIZE) {
+    const oldestKey = rejectedTokens.keys().next().value;
+    if (oldestKey !== undefined) {
+      rejectedTokens.delete(oldestKey);
+    }
+  }
+};
+
+const BEARER_PREFIX_LENGTH = 'Bearer '.length;
+
+// Pull the token out of "Authorization: Bearer <token>" with one prefix check
+// and one slice (the plugin's default splits the header and regex-tests it)
+const extractBearerToken = (request: FastifyRequest): string | undefined => {
+  const header = request.headers.authorization;
+  if (
+    !header ||
+    header.length <= BEARER_PREFIX_LENGTH ||
+    header.charCodeAt(BEARER_PREFIX_LENGTH - 1) !== 32 || // ' '
+    header.slice(0, BEARER_PREFIX_LENGTH - 1).toLowerCase() !== 'bearer'
+  ) {
+    return undefined;
+  }
+
+  return header.slice(BEARER_PREFIX_LENGTH).trim() || undefined;
+};
+
 export const authenticate = async (
   request: AuthRequest,
   reply: FastifyReply
 ): Promise<void> => {
   try {
-    // Verify JWT using Fastify's JWT plugin
-    await request.jwtVerify();
-
-    // The decoded token is available at request.user
-    const decoded = request.user as {
-      id: string;
-      email: string;
-      is_admin?: boolean;
-    };
-
-    // Attach user data to request
-    request.user = {
-      id: decoded.id,
-      email: decoded.email,
-      is_admin: decoded.is_admin,
-    };
+    // Read the header and call the plugin's (cached) verifier directly rather
+    // than request.jwtVerify(), which wraps the same verify in token lookup,
+    // callback and decorator plumbing on every request
+    const token = extractBearerToken(request);
+    if (!token) {
+      throw MISSING_TOKEN_ERROR;
+    }
+    const rejectedKey = rejectedTokenKey(token);
+    if (isRecentlyRejected(rejectedKey)) {
+      throw INVALID_TOKEN_ERROR;
+    }
+
+    // Attach the verified payload as-is (id, email, optional is_admin plus
+    // iat/exp); it is not copied field by field into a new object
+    try {
+      request.user = request.server.jwt.verify<{
+        id: string;
+        email: string;
+        is_admin?: boolean;
+      }>(token);
+    } catch (error) {
+      rememberRejected(rejectedKey);
+      throw error;
+    }
   } catch (error) {
-    reply.status(401).send({ error: 'Invalid or expired token' });
+    reply.status(401).send(AUTH_ERROR_BODIES.invalidToken);
     throw error; // Prevent route handler from executing
   }
 };
@@ -48,18 +120,19 @@ export const requireAdmin = async (
     const user = request.user;
 
     if (!user?.id) {
-      reply.status(401).send({ error: 'Not authenticated' });
-      throw new Error('Not authenticated');
+      reply.status(401).send(AUTH_ERROR_BODIES.notAuthenticated);
+      throw NOT_AUTHENTICATED_ERROR;
     }
 
     if (user.is_admin === true) {
       return;
     }
 
-    const result = await pool.query<{ is_admin: boolean }>(
-      'SELECT is_admin FROM users WHERE id = $1 LIMIT 1',
-      [user.id]
-    );
+    const result = await pool.query<{ is_admin: boolean }>({
+      name: 'users-is-admin',
+      text: 'SELECT is_admin FROM users WHERE id = $1 LIMIT 1',
+      values: [user.id],
+    });
 
     if (result.rows[0]?.is_admin) {
       request.user = {
@@ -70,12 +143,12 @@ export const requireAdmin = async (
       return;
     }
 
-    reply.status(403).send({ error: 'Admin access required' });
-    throw new Error('Admin access required');
+    reply.status(403).send(AUTH_ERROR_BODIES.adminRequired);
+    throw ADMIN_REQUIRED_ERROR;
   } catch (error) {
     if (!reply.sent) {
       console.error('Admin check failed:', error);
-      reply.status(500).send({ error: 'Failed to verify admin access' });
+      reply.status(500).send(AUTH_ERROR_BODIES.adminCheckFailed);
     }
     throw error;
   }
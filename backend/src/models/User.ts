@@ -41,6 +41,8 @@ export const UserModel = {
 
   // Find user by email
   async findByEmail(email: string): Promise<User | null> {
+    // Deliberately unnamed: a prepared SELECT * breaks with "cached plan must
+    // not change result type" on every pooled connection after users gains a column
     const query = 'SELECT * FROM users WHERE email = $1';
     const result = await pool.query(query, [email]);
     return result.rows[0] || null;
@@ -59,6 +61,13 @@ export const UserModel = {
     await pool.query(query, [id]);
   },
 
+  // Replace stored password hash, only if it still matches the one that was verified
+  // (a concurrent password reset or rehash wins instead of being overwritten)
+  async updatePasswordHash(id: string, passwordHash: string, expectedHash: string): Promise<void> {
+    const query = 'UPDATE users SET password_hash = $2, updated_at = NOW() WHERE id = $1 AND password_hash = $3';
+    await pool.query(query, [id, passwordHash, expectedHash]);
+  },
+
   // Update user
   async update(id: string, updates: Partial<User>): Promise<User> {
     const fields = Object.keys(updates);
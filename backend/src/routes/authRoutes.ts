@@ -2,16 +2,48 @@ import { FastifyInstance } from 'fastify';
 import { authController } from '../controllers/authController';
 import { authenticate } from '../middleware/auth';
 
+// Response schemas let Fastify compile a dedicated serializer for the user
+// payload (instead of generic JSON.stringify) and drop any extra properties.
+const userResponseSchema = {
+  type: 'object',
+  properties: {
+    user_id: { type: 'string' },
+    email: { type: 'string' },
+    full_name: { type: 'string' },
+    plan: { type: 'string' },
+    tokens: { type: 'number' },
+    plan_expiry: { type: ['string', 'null'], format: 'date-time' },
+    preferred_ai_provider: { type: 'string' },
+    preferred_ai_model: { type: 'string' },
+    timezone: { type: 'string' },
+    is_admin: { type: 'boolean' },
+  },
+} as const;
+
+const sessionResponseSchema = {
+  type: 'object',
+  properties: {
+    message: { type: 'string' },
+    token: { type: 'string' },
+    user: userResponseSchema,
+  },
+} as const;
+
 export default async function authRoutes(fastify: FastifyInstance) {
   // POST /api/auth/register
-  fastify.post('/register', authController.register);
+  fastify.post('/register', {
+    schema: { response: { 201: sessionResponseSchema } }
+  }, authController.register);
 
   // POST /api/auth/login
-  fastify.post('/login', authController.login);
+  fastify.post('/login', {
+    schema: { response: { 200: sessionResponseSchema } }
+  }, authController.login);
 
   // GET /api/auth/me - Get current user
   fastify.get('/me', {
-    preHandler: authenticate as any
+    preHandler: authenticate as any,
+    schema: { response: { 200: userResponseSchema } }
   }, authController.me);
 
   // POST /api/auth/forgot-password - Request password reset
@@ -22,6 +54,7 @@ export default async function authRoutes(fastify: FastifyInstance) {
 
   // PATCH /api/auth/preferences - Update AI/model/timezone preferences
   fastify.patch('/preferences', {
-    preHandler: authenticate as any
+    preHandler: authenticate as any,
+    schema: { response: { 200: userResponseSchema } }
   }, authController.updatePreferences);
 }
@@ -8,29 +8,63 @@ import { AIModel } from '../agents/base';
 import pool from '../database/db';
 
 /**
- * Helper to parse streaming JSON field by field
- * Emits fields as they become complete in the JSON stream
+ * Incremental parser for the streamed week JSON ({ "week": [ {...}, ... ] })
+ * Tracks brace depth across chunks so each entry is parsed exactly once as
+ * soon as its closing brace arrives, instead of re-scanning the whole buffer
  */
-function* parseStreamingJSON(content: string) {
-  try {
-    // Try to parse complete JSON first
-    const parsed = JSON.parse(content);
-    if (parsed.week && Array.isArray(parsed.week)) {
-      for (const entry of parsed.week) {
-        yield { type: 'entry', entry };
+class StreamingWeekParser {
+  private buffer = '';
+  private offset = 0;
+  private depth = 0;
+  private inString = false;
+  private escaped = false;
+  private entryStart = -1;
+
+  get content(): string {
+    return this.buffer;
+  }
+
+  push(delta: string): any[] {
+    this.buffer += delta;
+    const entries: any[] = [];
+
+    for (; this.offset < this.buffer.length; this.offset++) {
+      const ch = this.buffer[this.offset];
+
+      if (this.inString) {
+        if (this.escaped) {
+          this.escaped = false;
+        } else if (ch === '\\') {
+          this.escaped = true;
+        } else if (ch === '"') {
+          this.inString = false;
+        }
+        continue;
       }
-    }
-  } catch (e) {
-    // Partial JSON - try to extract complete entries
-    const entryMatches = content.match(/\{[^{}]*"date"[^{}]*"channel"[^{}]*\}/g);
-    if (entryMatches) {
-      for (const match of entryMatches) {
-        try {
-          const entry = JSON.parse(match);
-          yield { type: 'entry', entry };
-        } catch {}
+
+      if (ch === '"') {
+        this.inString = true;
+      } else if (ch === '{' || ch === '[') {
+        this.depth++;
+        // Depth 3 = object inside the top-level "week" array
+        if (ch === '{' && this.depth === 3) {
+          this.entryStart = this.offset;
+        }
+      } else if (ch === '}' || ch === ']') {
+        if (ch === '}' && this.depth === 3 && this.entryStart >= 0) {
+          try {
+            const entry = JSON.parse(this.buffer.slice(this.entryStart, this.offset + 1));
+            if (entry?.date && entry?.channel) {
+              entries.push(entry);
+            }
+          } catch {}
+          this.entryStart = -1;
+        }
+        this.depth--;
       }
     }
+
+    return entries;
   }
 }
 
@@ -495,8 +529,7 @@ Generate content for ALL dates and channels, skipping only perfect content. 🎬
       sendEvent('status', { message: `Generating with ${model}...`, model });
 
       // Stream the AI response
-      let fullContent = '';
-      let lastParsedCount = 0;
+      const weekParser = new StreamingWeekParser();
       const seenEntries = new Set<string>();
 
       for await (const chunk of aiService.generateStream({
@@ -508,16 +541,12 @@ Generate content for ALL dates and channels, skipping only perfect content. 🎬
         responseFormat: 'json',
       })) {
         if (chunk.type === 'chunk' && chunk.content) {
-          fullContent += chunk.content;
-
-          // Try to parse and emit complete entries as they appear
-          for (const result of parseStreamingJSON(fullContent)) {
-            if (result.type === 'entry' && result.entry) {
-              const entryKey = `${result.entry.date}-${result.entry.channel}`;
-              if (!seenEntries.has(entryKey)) {
-                seenEntries.add(entryKey);
-                sendEvent('entry', { entry: result.entry });
-              }
+          // Emit complete entries as they appear
+          for (const entry of weekParser.push(chunk.content)) {
+            const entryKey = `${entry.date}-${entry.channel}`;
+            if (!seenEntries.has(entryKey)) {
+              seenEntries.add(entryKey);
+              sendEvent('entry', { entry });
             }
           }
         }
@@ -527,7 +556,7 @@ Generate content for ALL dates and channels, skipping only perfect content. 🎬
 
           // Final parse
           try {
-            const parsed = JSON.parse(chunk.content || fullContent);
+            const parsed = JSON.parse(chunk.content || weekParser.content);
             const allEntries = parsed.week || [];
 
             // Send any entries we missed during streaming
@@ -1,3 +1,5 @@
+// Must be first: sizes the libuv threadpool before any module can start it
+import './utils/threadpool';
 import Fastify from 'fastify';
 import cors from '@fastify/cors';
 import helmet from '@fastify/helmet';
@@ -25,6 +27,14 @@ import eventRefreshRoutes from './routes/eventRefresh';
 
 // Import database
 import pool from './database/db';
+import { agentConfigService } from './services/agentConfig';
+import {
+  JWT_KEY,
+  JWT_ALGORITHM,
+  JWT_EXPIRES_IN,
+  JWT_VERIFY_CACHE_SIZE,
+  JWT_VERIFY_CACHE_TTL_MS,
+} from './utils/jwtConfig';
 
 // Load environment variables
 dotenv.config();
@@ -54,7 +64,19 @@ const startServer = async () => {
   try {
     // Register JWT plugin
     await fastify.register(jwt, {
-      secret: process.env.JWT_SECRET || 'default-secret-key',
+      secret: JWT_KEY,
+      sign: {
+        algorithm: JWT_ALGORITHM,
+        expiresIn: JWT_EXPIRES_IN,
+      },
+      verify: {
+        algorithms: [JWT_ALGORITHM],
+        // Reuse verification results for tokens seen recently (same session
+        // hitting many endpoints) instead of re-running HMAC + decode per request
+        // (bounded LRU; size 0 disables it)
+        cache: JWT_VERIFY_CACHE_SIZE > 0 ? JWT_VERIFY_CACHE_SIZE : false,
+        cacheTTL: JWT_VERIFY_CACHE_TTL_MS, // never beyond the token's own exp
+      },
     });
 
     // Register CORS
@@ -114,6 +136,25 @@ const startServer = async () => {
       });
     });
 
+    // Write queued agent performance metrics before shutting down (the flush
+    // timer is unref'd, so nothing else drains the queue on exit)
+    fastify.addHook('onClose', async () => {
+      try {
+        await agentConfigService.flushPerformanceMetrics();
+      } catch (error) {
+        console.error('Failed to flush agent performance metrics on shutdown:', error);
+      }
+    });
+
+    // Close gracefully on deploy/restart so onClose hooks run
+    for (const signal of ['SIGTERM', 'SIGINT'] as const) {
+      process.once(signal, () => {
+        fastify.close()
+          .catch(error => console.error('Error during shutdown:', error))
+          .finally(() => process.exit(0));
+      });
+    }
+
     // Test database connection
     await pool.query('SELECT NOW()');
     console.log('✅ Database connected successfully');
@@ -62,10 +62,28 @@ export interface EventCacheEntry {
   updatedAt: Date;
 }
 
+export interface PerformanceMetricInput {
+  agentName: string;
+  modelUsed: string;
+  taskType?: string;
+  tokensUsed: number;
+  executionTimeMs: number;
+  success: boolean;
+  errorMessage?: string;
+  qualityScore?: number;
+  costEstimate?: number;
+}
+
+const PERFORMANCE_FLUSH_INTERVAL_MS = 1000;
+const PERFORMANCE_FLUSH_BATCH_SIZE = 500;
+const PERFORMANCE_QUEUE_LIMIT = 10000;
+
 class AgentConfigService {
   private configCache: Map<string, AgentConfiguration> = new Map();
   private promptCache: Map<string, Map<string, AgentPrompt>> = new Map();
   private cacheExpiry: number = 5 * 60 * 1000; // 5 minutes
+  private performanceQueue: Array<PerformanceMetricInput & { recordedAt: Date }> = [];
+  private performanceFlushTimer: NodeJS.Timeout | null = null;
 
   /**
    * Get configuration for a specific agent
@@ -346,35 +364,73 @@ class AgentConfigService {
 
   /**
    * Track agent performance
+   * Queued and written in batches (every 1s or 500 metrics) instead of one INSERT per call
    */
-  async trackPerformance(metrics: {
-    agentName: string;
-    modelUsed: string;
-    taskType?: string;
-    tokensUsed: number;
-    executionTimeMs: number;
-    success: boolean;
-    errorMessage?: string;
-    qualityScore?: number;
-    costEstimate?: number;
-  }): Promise<void> {
-    await pool.query(
-      `INSERT INTO agent_performance_metrics
-       (agent_name, model_used, task_type, tokens_used, execution_time_ms,
-        success, error_message, quality_score, cost_estimate)
-       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)`,
-      [
-        metrics.agentName,
-        metrics.modelUsed,
-        metrics.taskType,
-        metrics.tokensUsed,
-        metrics.executionTimeMs,
-        metrics.success,
-        metrics.errorMessage,
-        metrics.qualityScore,
-        metrics.costEstimate
-      ]
-    );
+  async trackPerformance(metrics: PerformanceMetricInput): Promise<void> {
+    if (this.performanceQueue.length >= PERFORMANCE_QUEUE_LIMIT) {
+      return; // Drop rather than grow unbounded if the database is unreachable
+    }
+
+    this.performanceQueue.push({ ...metrics, recordedAt: new Date() });
+
+    if (this.performanceQueue.length >= PERFORMANCE_FLUSH_BATCH_SIZE) {
+      await this.flushPerformanceMetrics();
+    } else if (!this.performanceFlushTimer) {
+      this.performanceFlushTimer = setTimeout(() => {
+        // Failures are logged (with the batch size) by flushPerformanceMetrics
+        this.flushPerformanceMetrics().catch(() => {});
+      }, PERFORMANCE_FLUSH_INTERVAL_MS);
+      this.performanceFlushTimer.unref();
+    }
+  }
+
+  /**
+   * Write all queued performance metrics in a single INSERT
+   */
+  async flushPerformanceMetrics(): Promise<void> {
+    if (this.performanceFlushTimer) {
+      clearTimeout(this.performanceFlushTimer);
+      this.performanceFlushTimer = null;
+    }
+
+    const batch = this.performanceQueue.splice(0, this.performanceQueue.length);
+    if (batch.length === 0) return;
+
+    // Rows for unknown agents are skipped so one bad name can't fail the batch
+    let result;
+    try {
+      result = await pool.query(
+        `INSERT INTO agent_performance_metrics
+         (agent_name, model_used, task_type, tokens_used, execution_time_ms,
+          success, error_message, quality_score, cost_estimate, created_at)
+         SELECT t.*
+         FROM unnest($1::varchar[], $2::varchar[], $3::varchar[], $4::int[], $5::int[],
+                     $6::boolean[], $7::text[], $8::numeric[], $9::numeric[], $10::timestamptz[])
+           AS t(agent_name, model_used, task_type, tokens_used, execution_time_ms,
+                success, error_message, quality_score, cost_estimate, created_at)
+         WHERE EXISTS (SELECT 1 FROM agent_configurations ac WHERE ac.agent_name = t.agent_name)`,
+        [
+          batch.map(m => m.agentName),
+          batch.map(m => m.modelUsed),
+          batch.map(m => m.taskType ?? null),
+          batch.map(m => Math.round(m.tokensUsed)),
+          batch.map(m => Math.round(m.executionTimeMs)),
+          batch.map(m => m.success),
+          batch.map(m => m.errorMessage ?? null),
+          batch.map(m => m.qualityScore ?? null),
+          batch.map(m => m.costEstimate ?? null),
+          batch.map(m => m.recordedAt)
+        ]
+      );
+    } catch (error) {
+      console.error(`Failed to flush ${batch.length} agent performance metrics:`, error);
+      throw error;
+    }
+
+    const dropped = batch.length - (result.rowCount ?? 0);
+    if (dropped > 0) {
+      console.warn(`Dropped ${dropped} of ${batch.length} agent performance metrics for unknown agents`);
+    }
   }
 
   /**
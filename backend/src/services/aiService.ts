@@ -10,14 +10,28 @@ import OpenAI from 'openai';
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import { AIModel } from '../agents/base';
 
-// Initialize AI clients
-const anthropic = new Anthropic({
-  apiKey: process.env.ANTHROPIC_API_KEY || '',
-});
+// AI clients are created lazily on first use so importing this module
+// (every agent and route does) doesn't pay for SDK/HTTP client setup
+let anthropicClient: Anthropic | null = null;
+let openaiClient: OpenAI | null = null;
+
+const getAnthropic = (): Anthropic => {
+  if (!anthropicClient) {
+    anthropicClient = new Anthropic({
+      apiKey: process.env.ANTHROPIC_API_KEY || '',
+    });
+  }
+  return anthropicClient;
+};
 
-const openai = new OpenAI({
-  apiKey: process.env.OPENAI_API_KEY || '',
-});
+const getOpenAI = (): OpenAI => {
+  if (!openaiClient) {
+    openaiClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY || '',
+    });
+  }
+  return openaiClient;
+};
 
 // Gemini Key Rotation Manager
 class GeminiKeyManager {
@@ -25,6 +39,7 @@ class GeminiKeyManager {
   private currentKeyIndex = 0;
   private keyUsageCount: Map<number, number> = new Map();
   private keyLastUsed: Map<number, number> = new Map();
+  private clients: Map<string, GoogleGenerativeAI> = new Map();
 
   constructor() {
     // Load all 9 Gemini API keys
@@ -63,6 +78,20 @@ class GeminiKeyManager {
     return key;
   }
 
+  /**
+   * Get a client for the next key in rotation, reusing one client per key
+   * instead of constructing a new SDK instance on every request
+   */
+  getNextClient(): GoogleGenerativeAI {
+    const key = this.getNextKey();
+    let client = this.clients.get(key);
+    if (!client) {
+      client = new GoogleGenerativeAI(key);
+      this.clients.set(key, client);
+    }
+    return client;
+  }
+
   /**
    * Get usage statistics
    */
@@ -76,7 +105,31 @@ class GeminiKeyManager {
   }
 }
 
-const geminiKeyManager = new GeminiKeyManager();
+let geminiKeyManager: GeminiKeyManager | null = null;
+
+const getGeminiKeyManager = (): GeminiKeyManager => {
+  if (!geminiKeyManager) {
+    geminiKeyManager = new GeminiKeyManager();
+  }
+  return geminiKeyManager;
+};
+
+// Dimensions of the deterministic fallback (never persisted as a real embedding)
+export const DETERMINISTIC_EMBEDDING_DIMENSIONS = 64;
+
+// text-embedding-3 accepts 8191 tokens per input (~4 chars per token)
+const MAX_EMBEDDING_INPUT_CHARS = 30000;
+
+// Embedding requests are split into batches sent with bounded concurrency.
+// Large batches amortize per-request overhead; OpenAI accepts up to 2048 inputs
+// and 300k tokens per request, so batches are also cut on an estimated token
+// budget (~4 chars per token, with headroom for token-dense text).
+const EMBEDDING_BATCH_TOKEN_BUDGET = 250000;
+const EMBEDDING_BATCH_SIZE = Math.min(
+  2048,
+  Math.max(1, parseInt(process.env.EMBEDDING_BATCH_SIZE || '512', 10) || 512)
+);
+const EMBEDDING_CONCURRENCY = Math.max(1, parseInt(process.env.EMBEDDING_CONCURRENCY || '4', 10) || 4);
 
 export interface AIRequest {
   model: AIModel;
@@ -209,22 +262,66 @@ export class AIService {
 
     const embeddingModel = options?.model || 'text-embedding-3-small';
 
-    if (!openai.apiKey) {
+    if (!process.env.OPENAI_API_KEY) {
       console.warn('OpenAI API key missing; falling back to deterministic embeddings.');
       return texts.map(text => this.generateDeterministicEmbedding(text));
     }
 
-    try {
-      const response = await openai.embeddings.create({
-        model: embeddingModel,
-        input: texts
-      });
-
-      return response.data.map((item, index) => item.embedding ?? this.generateDeterministicEmbedding(texts[index]));
-    } catch (error) {
-      console.warn('Embedding API failed, using deterministic fallback.', error);
-      return texts.map(text => this.generateDeterministicEmbedding(text));
+    // Cap each input once so a single oversized document can't push the
+    // request past the model's context limit (which would fail the whole batch)
+    const inputs = texts.map(text =>
+      text.length > MAX_EMBEDDING_INPUT_CHARS ? text.slice(0, MAX_EMBEDDING_INPUT_CHARS) : text
+    );
+
+    // Split into batches and embed them concurrently (bounded, to stay within
+    // rate limits); a failed batch only falls back for its own texts
+    const batches: Array<[number, number]> = [];
+    let batchStart = 0;
+    let batchTokens = 0;
+    for (let i = 0; i < inputs.length; i++) {
+      const tokens = Math.ceil(inputs[i].length / 4);
+      if (
+        i > batchStart &&
+        (i - batchStart >= EMBEDDING_BATCH_SIZE || batchTokens + tokens > EMBEDDING_BATCH_TOKEN_BUDGET)
+      ) {
+        batches.push([batchStart, i]);
+        batchStart = i;
+        batchTokens = 0;
+      }
+      batchTokens += tokens;
     }
+    batches.push([batchStart, inputs.length]);
+
+    const embeddings: number[][] = new Array(texts.length);
+    let nextBatch = 0;
+
+    const worker = async (): Promise<void> => {
+      while (nextBatch < batches.length) {
+        const [start, end] = batches[nextBatch++];
+
+        try {
+          const response = await getOpenAI().embeddings.create({
+            model: embeddingModel,
+            input: inputs.slice(start, end)
+          });
+
+          for (let i = start; i < end; i++) {
+            embeddings[i] = response.data[i - start]?.embedding ?? this.generateDeterministicEmbedding(texts[i]);
+          }
+        } catch (error) {
+          console.warn('Embedding API failed, using deterministic fallback.', error);
+          for (let i = start; i < end; i++) {
+            embeddings[i] = this.generateDeterministicEmbedding(texts[i]);
+          }
+        }
+      }
+    };
+
+    await Promise.all(
+      Array.from({ length: Math.min(EMBEDDING_CONCURRENCY, batches.length) }, () => worker())
+    );
+
+    return embeddings;
   }
 
   /**
@@ -282,7 +379,7 @@ export class AIService {
       systemContent = request.systemPrompt;
     }
 
-    const response = await anthropic.messages.create({
+    const response = await getAnthropic().messages.create({
       model: anthropicModel,
       max_tokens: request.maxTokens || 4096,
       temperature: request.temperature || 0.7,
@@ -336,7 +433,7 @@ export class AIService {
 
     const openaiModel = modelMap[request.model] || 'gpt-4o';
 
-    const response = await openai.chat.completions.create({
+    const response = await getOpenAI().chat.completions.create({
       model: openaiModel,
       messages: [
         { role: 'system', content: request.systemPrompt },
@@ -374,9 +471,8 @@ export class AIService {
 
     const geminiModelName = modelMap[request.model] || 'gemini-2.0-flash-exp';
 
-    // Get next API key from rotation
-    const apiKey = geminiKeyManager.getNextKey();
-    const genAI = new GoogleGenerativeAI(apiKey);
+    // Get next client from key rotation
+    const genAI = getGeminiKeyManager().getNextClient();
     const model = genAI.getGenerativeModel({ model: geminiModelName });
 
     // Combine system and user prompts for Gemini
@@ -462,7 +558,7 @@ export class AIService {
 
     const openaiModel = modelMap[request.model] || 'gpt-4o';
 
-    const stream = await openai.chat.completions.create({
+    const stream = await getOpenAI().chat.completions.create({
       model: openaiModel,
       messages: [
         { role: 'system', content: request.systemPrompt },
@@ -519,7 +615,7 @@ export class AIService {
 
     const anthropicModel = modelMap[request.model] || 'claude-sonnet-4-20250514';
 
-    const stream = await anthropic.messages.stream({
+    const stream = await getAnthropic().messages.stream({
       model: anthropicModel,
       max_tokens: request.maxTokens || 4096,
       temperature: request.temperature || 0.7,
@@ -582,9 +678,8 @@ export class AIService {
 
     const geminiModelName = modelMap[request.model] || 'gemini-2.0-flash-exp';
 
-    // Get next API key from rotation
-    const apiKey = geminiKeyManager.getNextKey();
-    const genAI = new GoogleGenerativeAI(apiKey);
+    // Get next client from key rotation
+    const genAI = getGeminiKeyManager().getNextClient();
     const model = genAI.getGenerativeModel({ model: geminiModelName });
 
     const fullPrompt = `${request.systemPrompt}\n\n${request.userPrompt}`;
@@ -648,7 +743,7 @@ export class AIService {
   /**
    * Deterministic embedding fallback when API access is unavailable
    */
-  private generateDeterministicEmbedding(text: string, dimensions = 64): number[] {
+  private generateDeterministicEmbedding(text: string, dimensions = DETERMINISTIC_EMBEDDING_DIMENSIONS): number[] {
     const vector = new Array(dimensions).fill(0);
     if (!text) {
       return vector;
@@ -747,8 +842,7 @@ export class AIService {
         'gemini-2.5-flash': 'gemini-2.0-flash-exp',
       };
 
-      const apiKey = geminiKeyManager.getNextKey();
-      const genAI = new GoogleGenerativeAI(apiKey);
+      const genAI = getGeminiKeyManager().getNextClient();
       const model = genAI.getGenerativeModel({ model: modelMap[request.model] || 'gemini-2.0-flash-exp' });
 
       const fullPrompt = `${request.systemPrompt}\n\n${request.userPrompt}`;
@@ -774,7 +868,7 @@ export class AIService {
         'claude-haiku-4.5': 'claude-haiku-4-5-20251001',
       };
 
-      const stream = await anthropic.messages.stream({
+      const stream = await getAnthropic().messages.stream({
         model: modelMap[request.model] || 'claude-sonnet-4-20250514',
         max_tokens: request.maxTokens || 4096,
         temperature: request.temperature || 0.7,
@@ -788,7 +882,7 @@ export class AIService {
         }
       }
     } else {
-      const stream = await openai.chat.completions.create({
+      const stream = await getOpenAI().chat.completions.create({
         model: request.model === 'gpt-4o' ? 'gpt-4o' : 'gpt-4o-mini',
         messages: [
           { role: 'system', content: request.systemPrompt },
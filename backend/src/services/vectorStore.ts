@@ -1,5 +1,9 @@
 import pool from '../database/db';
-import { aiService } from './aiService';
+import { aiService, DETERMINISTIC_EMBEDDING_DIMENSIONS } from './aiService';
+
+const EMBEDDING_MODEL = 'text-embedding-3-small';
+const QUERY_EMBEDDING_CACHE_SIZE = 1000;
+const QUERY_EMBEDDING_CACHE_TTL = 60 * 60 * 1000; // 1 hour
 
 export interface VectorDocumentInput {
   sourceType: string;
@@ -20,6 +24,9 @@ export interface VectorMatch {
 }
 
 class BrandVectorStore {
+  // LRU of query text -> embedding (Map keeps insertion order; hits are re-inserted)
+  private queryEmbeddingCache = new Map<string, { embedding: number[]; timestamp: number }>();
+
   async upsertDocuments(brandId: string, documents: VectorDocumentInput[]): Promise<void> {
     if (!documents.length) return;
 
@@ -35,7 +42,7 @@ class BrandVectorStore {
           ? `INSERT INTO brand_knowledge_vectors
                (brand_id, source_type, source_id, content, summary, metadata, embedding)
              VALUES ($1, $2, $3, $4, $5, $6, $7)
-             ON CONFLICT (brand_id, source_type, source_id)
+             ON CONFLICT (brand_id, source_type, source_id) WHERE source_id IS NOT NULL
              DO UPDATE SET
                content = EXCLUDED.content,
                summary = EXCLUDED.summary,
@@ -89,17 +96,21 @@ class BrandVectorStore {
     const minScore = options?.minScore ?? 0.2;
     const sourceTypes = options?.sourceTypes;
 
-    let rows: any[] = [];
+    const filterSql = sourceTypes?.length ? 'AND source_type = ANY($2)' : '';
+    const filterParams = sourceTypes?.length ? [sourceTypes] : [];
+    // Named statements are parsed/planned once per pooled connection; the SQL
+    // text differs with the source-type filter, so each variant gets its own name
+    const statementSuffix = sourceTypes?.length ? '-by-source' : '';
+
+    // Cheap existence probe so brands without knowledge documents never pay
+    // for a query embedding
     try {
-      const result = await pool.query(
-        `SELECT id, source_type, source_id, content, summary, metadata, embedding
-         FROM brand_knowledge_vectors
-         WHERE brand_id = $1 ${sourceTypes?.length ? 'AND source_type = ANY($2)' : ''}
-         ORDER BY updated_at DESC
-         LIMIT 200`,
-        sourceTypes?.length ? [brandId, sourceTypes] : [brandId]
-      );
-      rows = result.rows;
+      const existing = await pool.query({
+        name: `brand-vectors-exists${statementSuffix}`,
+        text: `SELECT 1 FROM brand_knowledge_vectors WHERE brand_id = $1 ${filterSql} LIMIT 1`,
+        values: [brandId, ...filterParams]
+      });
+      if (!existing.rows.length) return [];
     } catch (error: any) {
       if (error?.code === '42P01') {
         return [];
@@ -107,80 +118,112 @@ class BrandVectorStore {
       throw error;
     }
 
-    if (!rows.length) return [];
-
-    const [queryEmbedding] = await aiService.createEmbeddings([queryText]);
+    const queryEmbedding = await this.getQueryEmbedding(queryText);
     if (!queryEmbedding) return [];
 
-    const matches: VectorMatch[] = rows
-      .map(row => {
-        let embedding: number[] = [];
-        if (Array.isArray(row.embedding)) {
-          embedding = row.embedding.map((value: any) => Number(value) || 0);
-        } else if (typeof row.embedding === 'string') {
+    let sumSquares = 0;
+    for (const value of queryEmbedding) {
+      sumSquares += value * value;
+    }
+    const queryNorm = Math.sqrt(sumSquares);
+    if (queryNorm === 0) return [];
+
+    // Score, filter and rank inside Postgres so only the top matches (without
+    // their embeddings) cross the wire, instead of 200 full vectors
+    const queryParamIndex = filterParams.length + 2;
+    const result = await pool.query({
+      name: `brand-vectors-rank${statementSuffix}`,
+      text: `WITH query_vector AS MATERIALIZED (
+         SELECT i, v
+         FROM unnest($${queryParamIndex}::float8[]) WITH ORDINALITY AS q(v, i)
+       ),
+       candidates AS (
+         SELECT id, embedding
+         FROM brand_knowledge_vectors
+         WHERE brand_id = $1 ${filterSql}
+         ORDER BY updated_at DESC
+         LIMIT 200
+       ),
+       scored AS (
+         SELECT c.id,
+           (SELECT SUM(e.value::float8 * q.v)
+                   / NULLIF(SQRT(SUM(e.value::float8 * e.value::float8)) * $${queryParamIndex + 4}::float8, 0)
+            FROM jsonb_array_elements_text(c.embedding) WITH ORDINALITY AS e(value, i)
+            JOIN query_vector q ON q.i = e.i) AS score
+         FROM candidates c
+         WHERE CASE WHEN jsonb_typeof(c.embedding) = 'array'
+                    THEN jsonb_array_length(c.embedding) END = $${queryParamIndex + 1}
+       ),
+       top_matches AS (
+         SELECT id, score
+         FROM scored
+         WHERE score >= $${queryParamIndex + 2}
+         ORDER BY score DESC
+         LIMIT $${queryParamIndex + 3}
+       )
+       SELECT v.id, v.source_type, v.source_id, v.content, v.summary, v.metadata, m.score
+       FROM top_matches m
+       JOIN brand_knowledge_vectors v ON v.id = m.id
+       ORDER BY m.score DESC`,
+      values: [brandId, ...filterParams, queryEmbedding, queryEmbedding.length, minScore, topK, queryNorm]
+    });
+
+    return result.rows.map(row => {
+      let metadata: Record<string, any> = {};
+      if (row.metadata) {
+        if (typeof row.metadata === 'string') {
           try {
-            const parsed = JSON.parse(row.embedding);
-            if (Array.isArray(parsed)) {
-              embedding = parsed.map((value: any) => Number(value) || 0);
-            }
+            metadata = JSON.parse(row.metadata);
           } catch {
-            embedding = [];
+            metadata = {};
           }
-        } else if (row.embedding && typeof row.embedding === 'object') {
-          const arr = Object.values(row.embedding);
-          embedding = arr.map((value: any) => Number(value) || 0);
+        } else if (typeof row.metadata === 'object') {
+          metadata = row.metadata;
         }
+      }
 
-        if (!embedding.length) return null;
-
-        const score = this.cosineSimilarity(queryEmbedding, embedding);
-        if (Number.isNaN(score) || score < minScore) return null;
-
-        let metadata: Record<string, any> = {};
-        if (row.metadata) {
-          if (typeof row.metadata === 'string') {
-            try {
-              metadata = JSON.parse(row.metadata);
-            } catch {
-              metadata = {};
-            }
-          } else if (typeof row.metadata === 'object') {
-            metadata = row.metadata;
-          }
-        }
-
-        return {
-          id: row.id,
-          content: row.content,
-          summary: row.summary || undefined,
-          metadata,
-          sourceType: row.source_type,
-          sourceId: row.source_id || undefined,
-          score
-        } as VectorMatch;
-      })
-      .filter((match): match is VectorMatch => Boolean(match))
-      .sort((a, b) => b.score - a.score)
-      .slice(0, topK);
-
-    return matches;
+      return {
+        id: row.id,
+        content: row.content,
+        summary: row.summary || undefined,
+        metadata,
+        sourceType: row.source_type,
+        sourceId: row.source_id || undefined,
+        score: Number(row.score)
+      };
+    });
   }
 
-  private cosineSimilarity(a: number[], b: number[]): number {
-    if (!a.length || !b.length || a.length !== b.length) return 0;
+  /**
+   * Embed a query, reusing recent embeddings for repeated queries
+   */
+  private async getQueryEmbedding(queryText: string): Promise<number[] | undefined> {
+    const key = queryText.trim();
+    const cached = this.queryEmbeddingCache.get(key);
+
+    if (cached) {
+      this.queryEmbeddingCache.delete(key);
+      if (Date.now() - cached.timestamp <= QUERY_EMBEDDING_CACHE_TTL) {
+        this.queryEmbeddingCache.set(key, cached);
+        return cached.embedding;
+      }
+    }
 
-    let dot = 0;
-    let normA = 0;
-    let normB = 0;
+    const [embedding] = await aiService.createEmbeddings([queryText], { model: EMBEDDING_MODEL });
+    if (!embedding) return undefined;
 
-    for (let i = 0; i < a.length; i++) {
-      dot += a[i] * b[i];
-      normA += a[i] * a[i];
-      normB += b[i] * b[i];
+    // Fallback vectors are not cached so the real embedding is used once the API recovers
+    if (embedding.length !== DETERMINISTIC_EMBEDDING_DIMENSIONS) {
+      this.queryEmbeddingCache.set(key, { embedding, timestamp: Date.now() });
+      if (this.queryEmbeddingCache.size > QUERY_EMBEDDING_CACHE_SIZE) {
+        const oldestKey = this.queryEmbeddingCache.keys().next().value;
+        if (oldestKey !== undefined) {
+          this.queryEmbeddingCache.delete(oldestKey);
+        }
+      }
     }
 
-    if (normA === 0 || normB === 0) return 0;
-    return dot / (Math.sqrt(normA) * Math.sqrt(normB));
+    return embedding;
   }
 }
 
@@ -0,0 +1,44 @@
+import fs from 'fs';
+import dotenv from 'dotenv';
+
+dotenv.config();
+
+// JWT settings are resolved once at import instead of re-reading process.env
+// (and re-encoding the secret) on every sign/verify call.
+export const JWT_SECRET = Buffer.from(process.env.JWT_SECRET || 'default-secret-key', 'utf8');
+export const JWT_EXPIRES_IN = process.env.JWT_EXPIRES_IN || '7d';
+
+// HS256 (shared secret) by default. EdDSA signs with an Ed25519 private key and
+// verifies with the public key, at HMAC-class speed, so a service that only
+// verifies never holds anything that can mint tokens.
+export const JWT_ALGORITHM: 'HS256' | 'EdDSA' = process.env.JWT_ALGORITHM === 'EdDSA' ? 'EdDSA' : 'HS256';
+
+// PEM from <NAME>_FILE, or inline in <NAME> (with \n escapes allowed)
+function readPemKey(name: string): string {
+  const file = process.env[`${name}_FILE`];
+  if (file) {
+    return fs.readFileSync(file, 'utf8');
+  }
+
+  const value = process.env[name];
+  if (!value) {
+    throw new Error(`${name} or ${name}_FILE is required when JWT_ALGORITHM=EdDSA`);
+  }
+  return value.replace(/\\n/g, '\n');
+}
+
+export const JWT_KEY = JWT_ALGORITHM === 'EdDSA'
+  ? { private: readPemKey('JWT_PRIVATE_KEY'), public: readPemKey('JWT_PUBLIC_KEY') }
+  : JWT_SECRET;
+
+// Verified-token cache (fast-jwt keys entries by a hash of the token, never
+// the raw token). A short TTL bounds how long a revoked session can linger;
+// entries never outlive the token's own exp.
+export const JWT_VERIFY_CACHE_SIZE = Math.max(0, parseInt(process.env.JWT_VERIFY_CACHE_SIZE || '10000', 10) || 0);
+export const JWT_VERIFY_CACHE_TTL_MS = Math.max(0, parseInt(process.env.JWT_VERIFY_CACHE_TTL_MS || '5000', 10) || 0);
+// Rejected tokens (bad signature, malformed, expired) are remembered in a
+// separate small cache in authenticate, so a replayed bad token costs one Map
+// lookup and a flood of distinct garbage tokens can't evict valid sessions
+// from the verify cache above. A rejection never becomes valid later.
+export const JWT_REJECTED_CACHE_SIZE = Math.max(0, parseInt(process.env.JWT_REJECTED_CACHE_SIZE || '2000', 10) || 0);
+export const JWT_REJECTED_CACHE_TTL_MS = Math.max(0, parseInt(process.env.JWT_REJECTED_CACHE_TTL_MS || '30000', 10) || 0);
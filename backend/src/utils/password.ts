@@ -0,0 +1,106 @@
+/**
+ * PASSWORD HASHING
+ *
+ * bcrypt (cost 12) stays the default: other services validate these hashes
+ * with passlib[bcrypt], and older deploys can only read bcrypt.
+ *
+ * PASSWORD_HASH_SCHEME=scrypt opts in to Node's native scrypt, which runs on
+ * the libuv threadpool so a login or signup never blocks the event loop
+ * (bcryptjs is pure JavaScript and burns ~250ms of main-thread CPU per hash).
+ * Only then are hashes upgraded on login. scrypt hashes always verify, so the
+ * flag can be turned off again without locking anyone out.
+ *
+ * scrypt hashes use the PHC string format:
+ *   $scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt base64>$<hash base64>
+ *
+ * PASSWORD_SCRYPT_LOG_N tunes the work factor (14-17).
+ */
+
+import crypto from 'crypto';
+import { promisify } from 'util';
+import bcrypt from 'bcryptjs';
+
+const scrypt = promisify(crypto.scrypt) as (
+  password: crypto.BinaryLike,
+  salt: crypto.BinaryLike,
+  keylen: number,
+  options: crypto.ScryptOptions
+) => Promise<Buffer>;
+
+const USE_SCRYPT = (process.env.PASSWORD_HASH_SCHEME || 'bcrypt').toLowerCase() === 'scrypt';
+const BCRYPT_COST = 12;
+
+const SCRYPT_ID = '$scrypt$';
+// Work factor as log2(N); 15 (N = 32768, ~32MB, ~50-100ms) unless overridden.
+// Memory is 128 * N * r bytes per hash, and up to UV_THREADPOOL_SIZE (= CPU
+// count) hashes run at once from unauthenticated logins: 17 is 128MB each,
+// so the cap keeps the worst case at NCPU x 128MB.
+// Changing it only affects new hashes; old ones are upgraded on next login.
+const SCRYPT_LOG_N = Math.min(17, Math.max(14, parseInt(process.env.PASSWORD_SCRYPT_LOG_N || '15', 10) || 15));
+const SCRYPT_R = 8;
+const SCRYPT_P = 1;
+const SCRYPT_PARAMS = `ln=${SCRYPT_LOG_N},r=${SCRYPT_R},p=${SCRYPT_P}`;
+const SALT_BYTES = 16;
+const KEY_BYTES = 64;
+
+// Salts are carved out of one 2KB random block (refilled with a fresh buffer,
+// so handed-out slices never change) instead of a randomBytes call per hash
+const SALT_POOL_SALTS = 128;
+let saltPool = Buffer.alloc(0);
+let saltPoolOffset = 0;
+
+function nextSalt(): Buffer {
+  if (saltPoolOffset + SALT_BYTES > saltPool.length) {
+    saltPool = crypto.randomFillSync(Buffer.allocUnsafe(SALT_BYTES * SALT_POOL_SALTS));
+    saltPoolOffset = 0;
+  }
+  const salt = saltPool.subarray(saltPoolOffset, saltPoolOffset + SALT_BYTES);
+  saltPoolOffset += SALT_BYTES;
+  return salt;
+}
+
+function scryptOptions(logN: number, r: number, p: number): crypto.ScryptOptions {
+  // Default maxmem (32MB) is exactly 128 * N * r for N=2^15, r=8; leave headroom
+  return { N: 2 ** logN, r, p, maxmem: 256 * 2 ** logN * r };
+}
+
+// PHC strings use base64 without padding
+function toPhcBase64(value: Buffer): string {
+  return value.toString('base64').replace(/=+$/, '');
+}
+
+export async function hashPassword(password: string): Promise<string> {
+  if (!USE_SCRYPT) {
+    return bcrypt.hash(password, BCRYPT_COST);
+  }
+
+  const salt = nextSalt();
+  const key = await scrypt(password, salt, KEY_BYTES, scryptOptions(SCRYPT_LOG_N, SCRYPT_R, SCRYPT_P));
+
+  return `${SCRYPT_ID}${SCRYPT_PARAMS}$${toPhcBase64(salt)}$${toPhcBase64(key)}`;
+}
+
+export async function verifyPassword(password: string, storedHash: string): Promise<boolean> {
+  if (!storedHash.startsWith(SCRYPT_ID)) {
+    return bcrypt.compare(password, storedHash);
+  }
+
+  const [, , params, salt, hash] = storedHash.split('$');
+  const match = /^ln=(\d+),r=(\d+),p=(\d+)$/.exec(params || '');
+  if (!match || !salt || !hash) return false;
+
+  const expected = Buffer.from(hash, 'base64');
+  const actual = await scrypt(
+    password,
+    Buffer.from(salt, 'base64'),
+    expected.length,
+    scryptOptions(Number(match[1]), Number(match[2]), Number(match[3]))
+  );
+
+  return crypto.timingSafeEqual(actual, expected);
+}
+
+// True when scrypt is opted in and the stored hash is bcrypt or used other parameters
+export function needsRehash(storedHash: string): boolean {
+  return USE_SCRYPT && !storedHash.startsWith(`${SCRYPT_ID}${SCRYPT_PARAMS}$`);
+}
@@ -0,0 +1,17 @@
+import os from 'os';
+import dotenv from 'dotenv';
+
+// Runs before db.ts loads .env, so load it here or UV_THREADPOOL_SIZE from
+// .env would be ignored
+dotenv.config();
+
+// libuv's threadpool (crypto.scrypt, crypto.pbkdf2, zlib, dns.lookup, fs) is 4
+// threads by default, so at most 4 password hashes run at once no matter how
+// many cores the box has. Size it to the CPU count unless explicitly set.
+// Must run before anything touches the pool, so server.ts imports this first.
+if (!process.env.UV_THREADPOOL_SIZE) {
+  const cores = typeof os.availableParallelism === 'function'
+    ? os.availableParallelism()
+    : os.cpus().length;
+  process.env.UV_THREADPOOL_SIZE = String(Math.min(1024, Math.max(4, cores)));
+}